@@ -2,17 +2,20 @@ from asgiref.sync import sync_to_async
 from django.core.exceptions import ValidationError
 from django.db.models.query import QuerySet
 from django.http import Http404
-from django.shortcuts import get_object_or_404 as _get_object_or_404
 
 from rest_framework.settings import api_settings
 
 from . import views, mixins
 
+_MISSING = object()
+
 
 async def get_object_or_404(queryset, *filter_args, **filter_kwargs):
+    if hasattr(queryset, '_default_manager'):
+        queryset = queryset._default_manager.all()
     try:
-        return await sync_to_async(_get_object_or_404)(queryset, *filter_args, **filter_kwargs)
-    except (TypeError, ValueError, ValidationError):
+        return await queryset.aget(*filter_args, **filter_kwargs)
+    except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
         raise Http404
 
 
@@ -50,16 +53,18 @@ class GenericAPIView(views.APIView):
         )
 
         filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
-        obj = await sync_to_async(get_object_or_404)(queryset, **filter_kwargs)
+        obj = await get_object_or_404(queryset, **filter_kwargs)
 
-        await self.check_object_permissions(self.request, obj)
+        await sync_to_async(self.check_object_permissions)(self.request, obj)
 
         return obj
 
     async def get_serializer(self, *args, **kwargs):
-        serializer_class = await self.get_serializer_class()
-        kwargs.setdefault('context', await self.get_serializer_context())
-        return serializer_class(*args, **kwargs)
+        if not hasattr(self, '_cached_serializer_class'):
+            self._cached_serializer_class = await self.get_serializer_class()
+            self._cached_serializer_context = await self.get_serializer_context()
+        kwargs.setdefault('context', self._cached_serializer_context)
+        return self._cached_serializer_class(*args, **kwargs)
 
     async def get_serializer_class(self):
         assert self.serializer_class is not None, (
@@ -77,28 +82,38 @@ class GenericAPIView(views.APIView):
             'view': self
         }
 
+    def _get_filter_backends(self):
+        if 'filter_backends' in self.__dict__:
+            return tuple(backend() for backend in self.filter_backends)
+        cls = type(self)
+        backends = cls.__dict__.get('_filter_backend_instances')
+        if backends is None:
+            backends = tuple(backend() for backend in cls.filter_backends)
+            cls._filter_backend_instances = backends
+        return backends
+
     async def filter_queryset(self, queryset):
-        for backend in list(self.filter_backends):
-            queryset = backend().filter_queryset(self.request, queryset, self)
+        for backend in self._get_filter_backends():
+            queryset = backend.filter_queryset(self.request, queryset, self)
         return queryset
 
-    @property
-    async def paginator(self):
-        if not hasattr(self, '_paginator'):
-            if self.pagination_class is None:
-                self._paginator = None
-            else:
-                self._paginator = await self.pagination_class()
-        return self._paginator
+    async def _ensure_paginator(self):
+        paginator = getattr(self, '_paginator', _MISSING)
+        if paginator is _MISSING:
+            paginator = None if self.pagination_class is None else self.pagination_class()
+            self._paginator = paginator
+        return paginator
 
     async def paginate_queryset(self, queryset):
-        if self.paginator is None:
+        paginator = await self._ensure_paginator()
+        if paginator is None:
             return None
-        return await self.paginator.paginate_queryset(queryset, self.request, view=self)
+        return await paginator.paginate_queryset(queryset, self.request, view=self)
 
     async def get_paginated_response(self, data):
-        assert self.paginator is not None
-        return await self.paginator.get_paginated_response(data)
+        paginator = await self._ensure_paginator()
+        assert paginator is not None
+        return await paginator.get_paginated_response(data)
 
 
 class CreateAPIView(mixins.CreateModelAsyncMixin,
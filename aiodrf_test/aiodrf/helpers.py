@@ -1,15 +1,22 @@
-from re import findall
-from copy import deepcopy
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 from django.db import models
 from django.utils.text import capfirst
 from asyncio import iscoroutinefunction
 from asgiref.sync import sync_to_async
-from rest_framework.reverse import reverse
 from rest_framework.response import Response
 from rest_framework.validators import UniqueValidator
 
-getattr, reverse, deepcopy = sync_to_async(getattr), sync_to_async(reverse), sync_to_async(deepcopy)
-findall = sync_to_async(findall)
+_FIELD_INFO_CACHE = {}
+_MODEL_FIELD_KWARGS_CACHE = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=256)
+def _camel_to_kebab(name):
+    return ''.join(
+        '-' + char if index and 'A' <= char <= 'Z' else char
+        for index, char in enumerate(name)
+    ).lower()
 
 
 async def to_coroutine(function):
@@ -19,6 +26,10 @@ async def to_coroutine(function):
 
 
 async def get_field_info(obj):
+    field_info = _FIELD_INFO_CACHE.get(obj.__class__)
+    if field_info is not None:
+        return field_info
+
     fields, forward_relations = {}, {}
     if hasattr(obj.__class__, '_meta'):
         for field in obj.__class__._meta.get_fields(include_parents=False):
@@ -26,7 +37,9 @@ async def get_field_info(obj):
             if not field.remote_field or not field.auto_created:
                 data[field.name] = {}
     
-    return {'fields': fields, 'forward_relations': forward_relations}
+    field_info = {'fields': fields, 'forward_relations': forward_relations}
+    _FIELD_INFO_CACHE[obj.__class__] = field_info
+    return field_info
 
 
 async def get_errors_formatted(serializer):
@@ -39,9 +52,9 @@ async def get_errors_formatted(serializer):
         return errors_remplate
     error_details = []
     for key, val in serializer._errors.items():
-        url = await getattr(serializer, serializer.url_field_name, None)
+        url = getattr(serializer, serializer.url_field_name, None)
         error, error_detail = None, {'code': 403}
-        if type(val) == dict:
+        if isinstance(val, dict):
             error = val
         else:
             key = 'type' if key == 'type.type' else key
@@ -50,9 +63,7 @@ async def get_errors_formatted(serializer):
             continue
         if url:
             error_detail['source'] = {'pointer': url}
-        error_detail['detail'] = "The JSON field {0}caused an exception: {1}".format(
-            "\"" + key + "\" ", error[key][0].lower()
-        )
+        error_detail['detail'] = f'The JSON field "{key}" caused an exception: {error[key][0].lower()}'
         error_details.append(error_detail)
     if not error_details:
         return None
@@ -61,20 +72,25 @@ async def get_errors_formatted(serializer):
 
 
 async def get_type_from_model(obj_type):
-    return '-'.join(await findall('[A-Z][^A-Z]*', obj_type.__name__)).lower()
+    return _camel_to_kebab(obj_type.__name__)
 
 
 async def get_related_field(queryset, kwargs):
     object = await queryset.aget(id=kwargs['pk'])
     try:
         field_name = kwargs['field_name']
-        field = await getattr(object, field_name)
+        field = await sync_to_async(getattr)(object, field_name)
     except AttributeError:
         return Response({'data': None}, status=404)
     else:
         return field
 
 async def get_related_field_objects(field):
+    try:
+        if field.prefetch_cache_name in field.instance._prefetched_objects_cache:
+            return list(field.all())
+    except AttributeError:
+        pass
     try:
         field = [obj async for obj in field.all()]
     except (AttributeError, TypeError):
@@ -82,15 +98,43 @@ async def get_related_field_objects(field):
     return field
 
 
-def get_relation_kwargs(field_name, relation_info):
+def _get_model_field_kwargs(model_field, field_name):
     """
-    Creates a default instance of a flat relational field.
+    Returns the relational field kwargs derived from the model field alone,
+    split into those that always apply and those valid for writable fields.
     """
     def needs_label(model_field, field_name):
         default_label = field_name.replace('_', ' ').capitalize()
         return capfirst(model_field.verbose_name) != default_label
 
+    cached = _MODEL_FIELD_KWARGS_CACHE.setdefault(model_field, {})
+    if field_name in cached:
+        return cached[field_name]
+
+    field_kwargs, writable_kwargs = {}, {}
+    if model_field.verbose_name and needs_label(model_field, field_name):
+        field_kwargs['label'] = capfirst(model_field.verbose_name)
+    help_text = model_field.help_text
+    if help_text:
+        field_kwargs['help_text'] = help_text
+    if not model_field.editable:
+        field_kwargs['read_only'] = True
+    if model_field.null:
+        field_kwargs['allow_null'] = True
+
+    if model_field.has_default() or model_field.blank or model_field.null:
+        writable_kwargs['required'] = False
+    if model_field.validators:
+        writable_kwargs['validators'] = model_field.validators
 
+    cached[field_name] = field_kwargs, writable_kwargs
+    return cached[field_name]
+
+
+def get_relation_kwargs(field_name, relation_info):
+    """
+    Creates a default instance of a flat relational field.
+    """
     def get_unique_error_message(model_field):
         unique_error_message = model_field.error_messages.get('unique', None)
         if unique_error_message:
@@ -103,7 +147,7 @@ def get_relation_kwargs(field_name, relation_info):
     model_field, related_model, to_many, to_field, has_through_model, reverse = relation_info
     kwargs = {
         'queryset': related_model._default_manager,
-        'view_name': '-'.join(findall.func('[A-Z][^A-Z]*', related_model.__name__)).lower() + '-detail'
+        'view_name': _camel_to_kebab(related_model.__name__) + '-detail'
     }
 
     if to_many:
@@ -123,26 +167,18 @@ def get_relation_kwargs(field_name, relation_info):
         kwargs.pop('queryset', None)
 
     if model_field:
-        if model_field.verbose_name and needs_label(model_field, field_name):
-            kwargs['label'] = capfirst(model_field.verbose_name)
-        help_text = model_field.help_text
-        if help_text:
-            kwargs['help_text'] = help_text
-        if not model_field.editable:
-            kwargs['read_only'] = True
-            kwargs.pop('queryset', None)
-        if model_field.null:
-            kwargs['allow_null'] = True
+        field_kwargs, writable_kwargs = _get_model_field_kwargs(model_field, field_name)
+        kwargs.update(field_kwargs)
         if kwargs.get('read_only', False):
             # If this field is read-only, then return early.
             # No further keyword arguments are valid.
+            kwargs.pop('queryset', None)
             return kwargs
 
-        if model_field.has_default() or model_field.blank or model_field.null:
-            kwargs['required'] = False
-        if model_field.validators:
-            kwargs['validators'] = model_field.validators
-        if getattr.func(model_field, 'unique', False):
+        kwargs.update(writable_kwargs)
+        if 'validators' in kwargs:
+            kwargs['validators'] = list(kwargs['validators'])
+        if getattr(model_field, 'unique', False):
             validator = UniqueValidator(
                 queryset=model_field.model._default_manager,
                 message=get_unique_error_message(model_field))
@@ -1,5 +1,5 @@
 from asgiref.sync import sync_to_async
-from django.db.models.query import prefetch_related_objects
+from django.db.models.query import QuerySet, prefetch_related_objects
 
 from rest_framework import status
 from rest_framework.response import Response
@@ -7,14 +7,33 @@ from rest_framework.settings import api_settings
 from rest_framework.mixins import (CreateModelMixin, ListModelMixin, RetrieveModelMixin, 
                                    UpdateModelMixin, DestroyModelMixin)
 
+try:
+    from django.db.models.query import aprefetch_related_objects
+except ImportError:  # Django < 5.0
+    aprefetch_related_objects = sync_to_async(prefetch_related_objects)
+
+
+async def _get_serializer_data(serializer):
+    # `adata` renders the whole representation in a single thread hop.
+    if hasattr(type(serializer), 'adata'):
+        return await serializer.adata
+    return await serializer.data
+
+
+async def _is_valid(serializer, raise_exception=False):
+    if hasattr(type(serializer), 'ais_valid'):
+        return await serializer.ais_valid(raise_exception=raise_exception)
+    return await serializer.is_valid(raise_exception=raise_exception)
+
 
 class CreateModelAsyncMixin(CreateModelMixin):
     async def create(self, request, *args, **kwargs):
         serializer = await self.get_serializer(data=request.data)
-        await serializer.is_valid(raise_exception=True)
+        await _is_valid(serializer, raise_exception=True)
         await self.perform_create(serializer)
-        headers = await self.get_success_headers(await serializer.data)
-        return Response(await serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+        data = await _get_serializer_data(serializer)
+        headers = await self.get_success_headers(data)
+        return Response(data, status=status.HTTP_201_CREATED, headers=headers)
 
     async def perform_create(self, serializer):
         await serializer.asave()
@@ -29,21 +48,43 @@ class CreateModelAsyncMixin(CreateModelMixin):
 class ListModelAsyncMixin(ListModelMixin):
     async def list(self, request, *args, **kwargs):
         queryset = await self.filter_queryset(await self.get_queryset())
+        lookups = await self.get_prefetch_related_lookups(queryset)
+        if lookups:
+            queryset = queryset.prefetch_related(*lookups)
 
         page = await self.paginate_queryset(queryset)
         if page is not None:
             serializer = await self.get_serializer(page, many=True)
-            return await self.get_paginated_response(await serializer.data)
+            payload = await _get_serializer_data(serializer)
+            return await self.get_paginated_response(payload)
 
         serializer = await self.get_serializer(queryset, many=True)
-        return Response(await serializer.data)
+        payload = await _get_serializer_data(serializer)
+        return Response(payload)
+
+    async def get_prefetch_related_lookups(self, queryset):
+        model = getattr(queryset, 'model', None)
+        meta = getattr(await self.get_serializer_class(), 'Meta', None)
+        if model is None or meta is None:
+            return ()
+        fields = getattr(meta, 'fields', None)
+        exclude = getattr(meta, 'exclude', None) or ()
+        prefetched = {
+            getattr(lookup, 'prefetch_to', lookup)
+            for lookup in queryset._prefetch_related_lookups
+        }
+        return tuple(
+            field.name for field in model._meta.many_to_many
+            if (fields in (None, '__all__') or field.name in fields)
+            and field.name not in exclude and field.name not in prefetched
+        )
 
 
 class RetrieveModelAsyncMixin(RetrieveModelMixin):
     async def retrieve(self, request, *args, **kwargs):
         instance = await self.get_object()
         serializer = await self.get_serializer(instance)
-        return Response(await serializer.data)
+        return Response(await _get_serializer_data(serializer))
 
 
 class UpdateModelAsyncMixin(UpdateModelMixin):
@@ -51,22 +92,23 @@ class UpdateModelAsyncMixin(UpdateModelMixin):
         partial = kwargs.pop('partial', False)
         instance = await self.get_object()
         serializer = await self.get_serializer(instance, data=request.data, partial=partial)
-        await serializer.is_valid(raise_exception=True)
+        await _is_valid(serializer, raise_exception=True)
         await self.perform_update(serializer)
 
-        queryset = await self.filter_queryset(await self.get_queryset())
-        if queryset._prefetch_related_lookups:
+        queryset = await self.get_queryset()
+        lookups = queryset._prefetch_related_lookups if isinstance(queryset, QuerySet) else ()
+        if lookups:
             instance._prefetched_objects_cache = {}
-            await sync_to_async(prefetch_related_objects)([instance], *queryset._prefetch_related_lookups)
+            await aprefetch_related_objects([instance], *lookups)
 
-        return Response(await serializer.data)
+        return Response(await _get_serializer_data(serializer))
 
     async def perform_update(self, serializer):
         await serializer.asave()
 
     async def partial_update(self, request, *args, **kwargs):
         kwargs['partial'] = True
-        return await self.aupdate(request, *args, **kwargs)
+        return await self.update(request, *args, **kwargs)
 
 
 class DestroyModelAsyncMixin(DestroyModelMixin):
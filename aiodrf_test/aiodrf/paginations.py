@@ -1,76 +1,72 @@
+import hashlib
 import warnings
-import contextlib
+from base64 import b64decode, b64encode
+from urllib import parse
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from rest_framework.pagination import PageNumberPagination, LimitOffsetPagination, CursorPagination
 from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.compat import coreapi, coreschema
 from django.template import loader
+from django.core.cache import caches
+from django.db.models import Q, QuerySet
+from django.core.exceptions import EmptyResultSet
 from django.utils.translation import gettext_lazy as _
 from django.core.paginator import InvalidPage
 from django.utils.encoding import force_str
 from collections import namedtuple
 from asgiref.sync import sync_to_async
 
-remove_query_param, replace_query_param = sync_to_async(remove_query_param), sync_to_async(replace_query_param)
-force_str = sync_to_async(force_str)
-
 Cursor = namedtuple('Cursor', ['offset', 'reverse', 'position'])
 PageLink = namedtuple('PageLink', ['url', 'number', 'is_active', 'is_break'])
 PAGE_BREAK = PageLink(url=None, number=None, is_active=False, is_break=True)
 
 
-async def _reverse_ordering(ordering_tuple):
-    async def invert(x):
-        return x[1:] if x.startswith('-') else '-' + x
+@lru_cache(maxsize=None)
+def _load_template(template_name):
+    return loader.get_template(template_name)
+
 
-    return tuple([await invert(item) for item in ordering_tuple])
+def _reverse_ordering(ordering_tuple):
+    return tuple(x[1:] if x.startswith('-') else '-' + x for x in ordering_tuple)
 
 
-async def _get_displayed_page_numbers(current, final):
+def _get_displayed_page_numbers(current, final):
     assert current >= 1
     assert final >= current
 
     if final <= 5:
         return list(range(1, final + 1))
-    included = {1, current - 1, current, current + 1, final}
-    
-    if current <= 4:
-        included.add(2)
-        included.add(3)
-    if current >= final - 3:
-        included.add(final - 1)
-        included.add(final - 2)
-
-    included = [
-        idx for idx in sorted(included)
-        if 0 < idx <= final
-    ]
 
-    if current > 4:
-        included.insert(1, None)
-    if current < final - 3:
-        included.insert(len(included) - 1, None)
-    return included
+    # The pages around `current` always form one run; it absorbs the
+    # leading 1-3 or trailing final-2..final block when those touch it.
+    start = 1 if current <= 4 else min(current - 1, final - 2)
+    end = final if current >= final - 3 else max(current + 1, 3)
+    head = [1, None] if current > 4 else []
+    tail = [None, final] if current < final - 3 else []
+    return head + list(range(start, end + 1)) + tail
+
+
+def _get_page_links(page_numbers, current, url_func):
+    make_link = PageLink._make
+    return [
+        PAGE_BREAK if page_number is None else
+        make_link((url_func(page_number), page_number, page_number == current, False))
+        for page_number in page_numbers
+    ]
 
 
-async def _get_page_links(page_numbers, current, url_func):
-    page_links = []
-    for page_number in page_numbers:
-        if page_number is None:
-            page_link = PAGE_BREAK
-        else:
-            page_link = PageLink(
-                url=await url_func(page_number),
-                number=page_number,
-                is_active=(page_number == current),
-                is_break=False
-            )
-        page_links.append(page_link)
-    return page_links
+def _get_count_cache_key(queryset):
+    try:
+        sql = str(queryset.query)
+    except (AttributeError, EmptyResultSet):
+        return None
+    return 'qcount:' + hashlib.md5(sql.encode()).hexdigest()
 
 
-async def _positive_int(integer_string, strict=False, cutoff=None):
+def _positive_int(integer_string, strict=False, cutoff=None):
     ret = int(integer_string)
     if ret < 0 or (ret == 0 and strict):
         raise ValueError()
@@ -79,9 +75,14 @@ async def _positive_int(integer_string, strict=False, cutoff=None):
     return ret
 
 
+def _divide_with_ceil(a, b):
+    return -(-a // b)
+
+
 class PageNumberAsyncPagination(PageNumberPagination):
     async def paginate_queryset(self, queryset, request, view=None):
         self.request = request
+        self.base_url = request.build_absolute_uri()
         page_size = await self.get_page_size(request)
         if not page_size:
             return None
@@ -89,8 +90,12 @@ class PageNumberAsyncPagination(PageNumberPagination):
         paginator = self.django_paginator_class(queryset, page_size)
         page_number = await self.get_page_number(request, paginator)
 
+        def get_page():
+            page = paginator.page(page_number)
+            return page, list(page)
+
         try:
-            self.page = await sync_to_async(paginator.page)(page_number)
+            self.page, results = await sync_to_async(get_page)()
         except InvalidPage as exc:
             msg = self.invalid_page_message.format(
                 page_number=page_number, message=str(exc)
@@ -100,7 +105,7 @@ class PageNumberAsyncPagination(PageNumberPagination):
         if paginator.num_pages > 1 and self.template is not None:
             self.display_page_controls = True
 
-        return list(self.page)
+        return results
 
     async def get_page_number(self, request, paginator):
         page_number = request.query_params.get(self.page_query_param) or 1
@@ -116,41 +121,41 @@ class PageNumberAsyncPagination(PageNumberPagination):
             'results': data,
         })
 
-    async def get_paginated_response_schema(self, schema):
-        return sync_to_async(super().get_paginated_response_schema)(self, schema)
+    def get_paginated_response_schema(self, schema):
+        return super().get_paginated_response_schema(schema)
 
     async def get_page_size(self, request):
-        return await sync_to_async(super().get_page_size)(self, request)
+        return super().get_page_size(request)
 
     async def get_next_link(self):
-        if not await self.page.has_next():
+        if not self.page.has_next():
             return None
-        url = await sync_to_async(self.request.build_absolute_uri)()
-        page_number = await self.page.next_page_number()
-        return await replace_query_param(url, self.page_query_param, page_number)
+        url = self.base_url
+        page_number = self.page.next_page_number()
+        return replace_query_param(url, self.page_query_param, page_number)
 
     async def get_previous_link(self):
-        if not await self.page.has_previous():
+        if not self.page.has_previous():
             return None
-        url = await sync_to_async(self.request.build_absolute_uri)()
-        page_number = await self.page.previous_page_number()
+        url = self.base_url
+        page_number = self.page.previous_page_number()
         if page_number == 1:
-            return await remove_query_param(url, self.page_query_param)
-        return await replace_query_param(url, self.page_query_param, page_number)
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, page_number)
 
     async def get_html_context(self):
-        base_url = await sync_to_async(self.request.build_absolute_uri)()
+        base_url = self.base_url
 
-        async def page_number_to_url(page_number):
+        def page_number_to_url(page_number):
             if page_number == 1:
-                return await remove_query_param(base_url, self.page_query_param)
+                return remove_query_param(base_url, self.page_query_param)
             else:
-                return await replace_query_param(base_url, self.page_query_param, page_number)
+                return replace_query_param(base_url, self.page_query_param, page_number)
 
         current = self.page.number
         final = self.page.paginator.num_pages
-        page_numbers = await _get_displayed_page_numbers(current, final)
-        page_links = await _get_page_links(page_numbers, current, page_number_to_url)
+        page_numbers = _get_displayed_page_numbers(current, final)
+        page_links = _get_page_links(page_numbers, current, page_number_to_url)
 
         return {
             'previous_url': await self.get_previous_link(),
@@ -159,7 +164,7 @@ class PageNumberAsyncPagination(PageNumberPagination):
         }
 
     async def to_html(self):
-        template = await sync_to_async(loader.get_template)(self.template)
+        template = _load_template(self.template)
         context = await self.get_html_context()
         return await sync_to_async(template.render)(context)
 
@@ -175,11 +180,11 @@ class PageNumberAsyncPagination(PageNumberPagination):
                 location='query',
                 schema=coreschema.Integer(
                     title='Page',
-                    description=await force_str(self.page_query_description)
+                    description=force_str(self.page_query_description)
                 )
             )
         ]
-        if await self.page_size_query_param is not None:
+        if self.page_size_query_param is not None:
             fields.append(
                 coreapi.Field(
                     name=self.page_size_query_param,
@@ -187,7 +192,7 @@ class PageNumberAsyncPagination(PageNumberPagination):
                     location='query',
                     schema=coreschema.Integer(
                         title='Page size',
-                        description=await force_str(self.page_size_query_description)
+                        description=force_str(self.page_size_query_description)
                     )
                 )
             )
@@ -199,7 +204,7 @@ class PageNumberAsyncPagination(PageNumberPagination):
                 'name': self.page_query_param,
                 'required': False,
                 'in': 'query',
-                'description': await force_str(self.page_query_description),
+                'description': force_str(self.page_query_description),
                 'schema': {
                     'type': 'integer',
                 },
@@ -211,7 +216,7 @@ class PageNumberAsyncPagination(PageNumberPagination):
                     'name': self.page_size_query_param,
                     'required': False,
                     'in': 'query',
-                    'description': await force_str(self.page_size_query_description),
+                    'description': force_str(self.page_size_query_description),
                     'schema': {
                         'type': 'integer',
                     },
@@ -221,20 +226,26 @@ class PageNumberAsyncPagination(PageNumberPagination):
 
 
 class LimitOffsetAsyncPagination(LimitOffsetPagination):
+    count_cache_alias, count_cache_timeout = 'default', 60
+
     async def paginate_queryset(self, queryset, request, view=None):
         self.request = request
+        self.base_url = request.build_absolute_uri()
         self.limit = await self.get_limit(request)
         if self.limit is None:
             return None
 
-        self.count = await self.get_count(queryset)
         self.offset = await self.get_offset(request)
+        self.count = await self.get_count(queryset)
         if self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
         if self.count == 0 or self.offset > self.count:
             return []
-        return list(queryset[self.offset:self.offset + self.limit])
+        results = queryset[self.offset:self.offset + self.limit]
+        if isinstance(results, QuerySet):
+            return [obj async for obj in results]
+        return list(results)
 
     async def get_paginated_response(self, data):
         return Response({
@@ -244,22 +255,24 @@ class LimitOffsetAsyncPagination(LimitOffsetPagination):
             'results': data
         })
 
-    async def get_paginated_response_schema(self, schema):
-        return sync_to_async(super().get_paginated_response_schema)(self, schema)
+    def get_paginated_response_schema(self, schema):
+        return super().get_paginated_response_schema(schema)
 
     async def get_limit(self, request):
         if self.limit_query_param:
-            with sync_to_async(contextlib.suppress)(KeyError, ValueError):
-                return await _positive_int(
+            try:
+                return _positive_int(
                     request.query_params[self.limit_query_param],
                     strict=True,
                     cutoff=self.max_limit
                 )
+            except (KeyError, ValueError):
+                pass
         return self.default_limit
 
     async def get_offset(self, request):
         try:
-            return await _positive_int(
+            return _positive_int(
                 request.query_params[self.offset_query_param],
             )
         except (KeyError, ValueError):
@@ -269,34 +282,34 @@ class LimitOffsetAsyncPagination(LimitOffsetPagination):
         if self.offset + self.limit >= self.count:
             return None
 
-        url = await sync_to_async(self.request.build_absolute_uri)()
-        url = await replace_query_param(url, self.limit_query_param, self.limit)
+        url = self.base_url
+        url = replace_query_param(url, self.limit_query_param, self.limit)
 
         offset = self.offset + self.limit
-        return await replace_query_param(url, self.offset_query_param, offset)
+        return replace_query_param(url, self.offset_query_param, offset)
 
     async def get_previous_link(self):
         if self.offset <= 0:
             return None
 
-        url = await sync_to_async(self.request.build_absolute_uri)()
-        url = await replace_query_param(url, self.limit_query_param, self.limit)
+        url = self.base_url
+        url = replace_query_param(url, self.limit_query_param, self.limit)
 
         if self.offset - self.limit <= 0:
-            return await remove_query_param(url, self.offset_query_param)
+            return remove_query_param(url, self.offset_query_param)
 
         offset = self.offset - self.limit
-        return await replace_query_param(url, self.offset_query_param, offset)
+        return replace_query_param(url, self.offset_query_param, offset)
 
     async def get_html_context(self):
-        base_url = self.request.build_absolute_uri()
+        base_url = self.base_url
 
         if self.limit:
-            current = await _divide_with_ceil(self.offset, self.limit) + 1
+            current = _divide_with_ceil(self.offset, self.limit) + 1
 
             final = (
-                await _divide_with_ceil(self.count - self.offset, self.limit) +
-                await _divide_with_ceil(self.offset, self.limit)
+                _divide_with_ceil(self.count - self.offset, self.limit) +
+                _divide_with_ceil(self.offset, self.limit)
             )
 
             final = max(final, 1)
@@ -307,15 +320,15 @@ class LimitOffsetAsyncPagination(LimitOffsetPagination):
         if current > final:
             current = final
 
-        async def page_number_to_url(page_number):
+        def page_number_to_url(page_number):
             if page_number == 1:
-                return await remove_query_param(base_url, self.offset_query_param)
+                return remove_query_param(base_url, self.offset_query_param)
             else:
                 offset = self.offset + ((page_number - current) * self.limit)
-                return await replace_query_param(base_url, self.offset_query_param, offset)
+                return replace_query_param(base_url, self.offset_query_param, offset)
 
-        page_numbers = await _get_displayed_page_numbers(current, final)
-        page_links = await _get_page_links(page_numbers, current, page_number_to_url)
+        page_numbers = _get_displayed_page_numbers(current, final)
+        page_links = _get_page_links(page_numbers, current, page_number_to_url)
 
         return {
             'previous_url': await self.get_previous_link(),
@@ -324,16 +337,28 @@ class LimitOffsetAsyncPagination(LimitOffsetPagination):
         }
 
     async def to_html(self):
-        template = await sync_to_async(loader.get_template)(self.template)
+        template = _load_template(self.template)
         context = await self.get_html_context()
         return await sync_to_async(template.render)(context)
 
     async def get_count(self, queryset):
+        # The first page always recomputes, so a fresh count is never hidden from it.
+        cache_key = _get_count_cache_key(queryset) if getattr(self, 'offset', 0) else None
+        if cache_key is not None:
+            cache = caches[self.count_cache_alias]
+            count = await cache.aget(cache_key)
+            if count is not None:
+                return count
+
         try:
-            return await sync_to_async(queryset.count)()
+            count = await queryset.acount()
         except (AttributeError, TypeError):
             return len(queryset)
 
+        if cache_key is not None:
+            await cache.aset(cache_key, count, self.count_cache_timeout)
+        return count
+
     async def get_schema_fields(self, view):
         assert coreapi is not None, 'coreapi must be installed to use `get_schema_fields()`'
         if coreapi is not None:
@@ -346,7 +371,7 @@ class LimitOffsetAsyncPagination(LimitOffsetPagination):
                 location='query',
                 schema=coreschema.Integer(
                     title='Limit',
-                    description=await force_str(self.limit_query_description)
+                    description=force_str(self.limit_query_description)
                 )
             ),
             coreapi.Field(
@@ -355,7 +380,7 @@ class LimitOffsetAsyncPagination(LimitOffsetPagination):
                 location='query',
                 schema=coreschema.Integer(
                     title='Offset',
-                    description=await force_str(self.offset_query_description)
+                    description=force_str(self.offset_query_description)
                 )
             )
         ]
@@ -366,7 +391,7 @@ class LimitOffsetAsyncPagination(LimitOffsetPagination):
                 'name': self.limit_query_param,
                 'required': False,
                 'in': 'query',
-                'description': await force_str(self.limit_query_description),
+                'description': force_str(self.limit_query_description),
                 'schema': {
                     'type': 'integer',
                 },
@@ -375,7 +400,7 @@ class LimitOffsetAsyncPagination(LimitOffsetPagination):
                 'name': self.offset_query_param,
                 'required': False,
                 'in': 'query',
-                'description': await force_str(self.offset_query_description),
+                'description': force_str(self.offset_query_description),
                 'schema': {
                     'type': 'integer',
                 },
@@ -391,24 +416,22 @@ class CursorPagination(CursorPagination):
         if not self.page_size:
             return None
 
-        self.base_url = await sync_to_async(request.build_absolute_uri)()
+        self.base_url = request.build_absolute_uri()
         self.ordering = await self.get_ordering(request, queryset, view)
 
-        self.cursor = await self.decode_cursor(request)
+        self.cursor = self.decode_cursor(request)
         if self.cursor is None:
             (offset, reverse, current_position) = (0, False, None)
         else:
             (offset, reverse, current_position) = self.cursor
 
         if reverse:
-            queryset = queryset.order_by(*await _reverse_ordering(self.ordering))
+            queryset = queryset.order_by(*self._reversed_ordering)
         else:
             queryset = queryset.order_by(*self.ordering)
 
-        if str(current_position) != 'None':
-            order = self.ordering[0]
-            is_reversed = order.startswith('-')
-            order_attr = order.lstrip('-')
+        if current_position is not None:
+            is_reversed, order_attr = self._order_is_reversed, self._order_attr
 
             if self.cursor.reverse != is_reversed:
                 kwargs = {order_attr + '__lt': current_position}
@@ -420,12 +443,12 @@ class CursorPagination(CursorPagination):
                 filter_query |= Q(**{order_attr + '__isnull': True})
             queryset = queryset.filter(filter_query)
 
-        results = list(queryset[offset:offset + self.page_size + 1])
+        results = [obj async for obj in queryset[offset:offset + self.page_size + 1]]
         self.page = list(results[:self.page_size])
 
         if len(results) > len(self.page):
             has_following_position = True
-            following_position = await self._get_position_from_instance(results[-1], self.ordering)
+            following_position = self._get_position(results[-1])
         else:
             has_following_position = False
             following_position = None
@@ -454,12 +477,14 @@ class CursorPagination(CursorPagination):
 
     async def get_page_size(self, request):
         if self.page_size_query_param:
-            with sync_to_async(contextlib.suppress)(KeyError, ValueError):
-                return await _positive_int(
+            try:
+                return _positive_int(
                     request.query_params[self.page_size_query_param],
                     strict=True,
                     cutoff=self.max_page_size
                 )
+            except (KeyError, ValueError):
+                pass
         return self.page_size
 
     async def get_next_link(self):
@@ -467,14 +492,14 @@ class CursorPagination(CursorPagination):
             return None
 
         if self.page and self.cursor and self.cursor.reverse and self.cursor.offset != 0:
-            compare = await self._get_position_from_instance(self.page[-1], self.ordering)
+            compare = self._get_position(self.page[-1])
         else:
             compare = self.next_position
         offset = 0
 
         has_item_with_unique_position = False
         for item in reversed(self.page):
-            position = await self._get_position_from_instance(item, self.ordering)
+            position = self._get_position(item)
             if position != compare:
                 has_item_with_unique_position = position is not None
                 break
@@ -497,21 +522,21 @@ class CursorPagination(CursorPagination):
             position = self.next_position
 
         cursor = Cursor(offset=offset, reverse=False, position=position)
-        return await self.encode_cursor(cursor)
+        return self.encode_cursor(cursor)
 
     async def get_previous_link(self):
         if not self.has_previous:
             return None
 
         if self.page and self.cursor and not self.cursor.reverse and self.cursor.offset != 0:
-            compare = await self._get_position_from_instance(self.page[0], self.ordering)
+            compare = self._get_position(self.page[0])
         else:
             compare = self.previous_position
         offset = 0
 
         has_item_with_unique_position = False
         for item in self.page:
-            position = await self._get_position_from_instance(item, self.ordering)
+            position = self._get_position(item)
             if position != compare:
                 has_item_with_unique_position = position is not None
                 break
@@ -534,7 +559,7 @@ class CursorPagination(CursorPagination):
             position = self.previous_position
 
         cursor = Cursor(offset=offset, reverse=True, position=position)
-        return await self.encode_cursor(cursor)
+        return self.encode_cursor(cursor)
 
     async def get_ordering(self, request, queryset, view):
         ordering = self.ordering
@@ -547,7 +572,9 @@ class CursorPagination(CursorPagination):
         if ordering_filters:
             filter_cls = ordering_filters[0]
             filter_instance = filter_cls()
-            ordering_from_filter = await sync_to_async(filter_instance.get_ordering)(request, queryset, view)
+            ordering_from_filter = await sync_to_async(
+                filter_instance.get_ordering, thread_sensitive=False
+            )(request, queryset, view)
             if ordering_from_filter:
                 ordering = ordering_from_filter
 
@@ -567,50 +594,58 @@ class CursorPagination(CursorPagination):
             )
         )
 
-        if isinstance(ordering, str):
-            return (ordering,)
-        return tuple(ordering)
+        ordering = (ordering,) if isinstance(ordering, str) else tuple(ordering)
+        self._reversed_ordering = _reverse_ordering(ordering)
+        self._order_attr = ordering[0].lstrip('-')
+        self._order_is_reversed = ordering[0].startswith('-')
+        self._position_getter = None
+        return ordering
 
-    async def decode_cursor(self, request):
+    def decode_cursor(self, request):
         encoded = request.query_params.get(self.cursor_query_param)
         if encoded is None:
             return None
 
         try:
-            querystring = b64decode(encoded.encode('ascii')).decode('ascii')
-            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            querystring = b64decode(encoded.encode('ascii')).decode()
+            tokens = dict(token.split('=', 1) for token in querystring.split('&') if token)
 
-            offset = tokens.get('o', ['0'])[0]
-            offset = _positive_int(offset, cutoff=self.offset_cutoff)
+            offset = _positive_int(tokens.get('o', '0'), cutoff=self.offset_cutoff)
+            reverse = bool(int(tokens.get('r', '0')))
 
-            reverse = tokens.get('r', ['0'])[0]
-            reverse = bool(int(reverse))
-
-            position = tokens.get('p', [None])[0]
+            position = tokens.get('p')
+            if position is not None:
+                position = parse.unquote_plus(position)
         except (TypeError, ValueError):
             raise NotFound(self.invalid_cursor_message)
 
         return Cursor(offset=offset, reverse=reverse, position=position)
 
-    async def encode_cursor(self, cursor):
-        tokens = {}
+    def encode_cursor(self, cursor):
+        tokens = []
         if cursor.offset != 0:
-            tokens['o'] = str(cursor.offset)
+            tokens.append(f'o={cursor.offset}')
         if cursor.reverse:
-            tokens['r'] = '1'
+            tokens.append('r=1')
         if cursor.position is not None:
-            tokens['p'] = cursor.position
+            tokens.append(f'p={parse.quote_plus(cursor.position)}')
+
+        encoded = b64encode('&'.join(tokens).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
 
-        querystring = parse.urlencode(tokens, doseq=True)
-        encoded = b64encode(querystring.encode('ascii')).decode('ascii')
-        return await replace_query_param(self.base_url, self.cursor_query_param, encoded)
+    def _get_position(self, instance):
+        if self._position_getter is None:
+            getter = itemgetter if isinstance(instance, dict) else attrgetter
+            self._position_getter = getter(self._order_attr)
+        attr = self._position_getter(instance)
+        return None if attr is None else str(attr)
 
-    async def _get_position_from_instance(self, instance, ordering):
+    def _get_position_from_instance(self, instance, ordering):
         field_name = ordering[0].lstrip('-')
-        if isinstance(instance, dict):
-            attr = instance[field_name]
-        else:
-            attr = getattr(instance, field_name)
+        if getattr(self, '_order_attr', None) == field_name:
+            return self._get_position(instance)
+        getter = itemgetter if isinstance(instance, dict) else attrgetter
+        attr = getter(field_name)(instance)
         return None if attr is None else str(attr)
 
     async def get_paginated_response(self, data):
@@ -620,7 +655,7 @@ class CursorPagination(CursorPagination):
             'results': data,
         })
 
-    async def get_paginated_response_schema(self, schema):
+    def get_paginated_response_schema(self, schema):
         return {
             'type': 'object',
             'required': ['results'],
@@ -650,9 +685,9 @@ class CursorPagination(CursorPagination):
         }
 
     async def to_html(self):
-        template = await sync_to_async(loader.get_template)(self.template)
+        template = _load_template(self.template)
         context = await self.get_html_context()
-        return sync_to_async(template.render)(context)
+        return await sync_to_async(template.render)(context)
 
     async def get_schema_fields(self, view):
         assert coreapi is not None, 'coreapi must be installed to use `get_schema_fields()`'
@@ -666,7 +701,7 @@ class CursorPagination(CursorPagination):
                 location='query',
                 schema=coreschema.String(
                     title='Cursor',
-                    description=await force_str(self.cursor_query_description)
+                    description=force_str(self.cursor_query_description)
                 )
             )
         ]
@@ -678,7 +713,7 @@ class CursorPagination(CursorPagination):
                     location='query',
                     schema=coreschema.Integer(
                         title='Page size',
-                        description=await force_str(self.page_size_query_description)
+                        description=force_str(self.page_size_query_description)
                     )
                 )
             )
@@ -690,7 +725,7 @@ class CursorPagination(CursorPagination):
                 'name': self.cursor_query_param,
                 'required': False,
                 'in': 'query',
-                'description': await force_str(self.cursor_query_description),
+                'description': force_str(self.cursor_query_description),
                 'schema': {
                     'type': 'string',
                 },
@@ -702,7 +737,7 @@ class CursorPagination(CursorPagination):
                     'name': self.page_size_query_param,
                     'required': False,
                     'in': 'query',
-                    'description': await force_str(self.page_size_query_description),
+                    'description': force_str(self.page_size_query_description),
                     'schema': {
                         'type': 'integer',
                     },
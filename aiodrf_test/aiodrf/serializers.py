@@ -1,28 +1,244 @@
 import asyncio
-from copy import deepcopy
+from inspect import isawaitable
+from copy import copy, deepcopy
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
 from traceback import format_exc
+from collections import ChainMap
 from collections.abc import Mapping
-from async_property import async_property, async_cached_property
-from asgiref.sync import sync_to_async
-from psycopg import AsyncConnection, OperationalError
+from weakref import WeakKeyDictionary
+from async_property.proxy import AwaitableOnly, AwaitableProxy
+from asgiref.sync import async_to_sync, sync_to_async
+from psycopg import OperationalError, sql
+from psycopg_pool import AsyncConnectionPool
+from django.conf import settings
 from django.db import connection
+from django.db.models import QuerySet
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.utils.functional import cached_property
 from rest_framework.utils import html, model_meta
 from rest_framework.serializers import (
-    ListSerializer, ModelSerializer, Serializer, SerializerMetaclass,
-    raise_errors_on_nested_writes, as_serializer_error
+    BaseSerializer, ListSerializer, ModelSerializer, Serializer,
+    SerializerMetaclass, as_serializer_error
 )
 from rest_framework.utils.serializer_helpers import (
     BindingDict, BoundField, JSONBoundField, 
     NestedBoundField, ReturnDict, ReturnList
 )
-from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.exceptions import ValidationError
 from rest_framework.fields import JSONField, SkipField, empty, get_error_detail 
 from rest_framework.settings import api_settings
 from rest_framework.relations import PKOnlyObject
 
-raise_errors_on_nested_writes = sync_to_async(raise_errors_on_nested_writes)
+_FIELD_INFO_CACHE = {}
+_FIELDS_CACHE = {}
+_ASYNC_WRAPPERS = {}
+# psycopg pools are bound to the loop that opened them, so keep one per loop.
+_PG_POOLS = WeakKeyDictionary()
+# PostgreSQL's protocol caps a single statement at 65535 bind parameters.
+_MAX_QUERY_PARAMS = 65535
+_LIST_SERIALIZER_KWARGS = frozenset((
+    'read_only', 'write_only', 'required', 'default', 'initial', 'source',
+    'label', 'help_text', 'style', 'error_messages', 'allow_empty',
+    'instance', 'data', 'partial', 'context', 'allow_null',
+    'max_length', 'min_length'
+))
+
+
+def _get_field_info(model):
+    field_info = _FIELD_INFO_CACHE.get(model)
+    if field_info is None:
+        field_info = _FIELD_INFO_CACHE[model] = model_meta.get_field_info(model)
+    return field_info
+
+
+def _get_async_wrapper(func, thread_sensitive):
+    key = (func, thread_sensitive)
+    wrapper = _ASYNC_WRAPPERS.get(key)
+    if wrapper is None:
+        wrapper = _ASYNC_WRAPPERS[key] = sync_to_async(func, thread_sensitive=thread_sensitive)
+    return wrapper
+
+
+def _awaitable_value(instance, cache_attr, fget, loader):
+    # Loaded values come back through a proxy that sync callers (renderers,
+    # exception handlers, repr) can read; otherwise awaiting runs the loader.
+    if hasattr(instance, cache_attr):
+        return AwaitableProxy(fget(instance))
+    return AwaitableOnly(loader)
+
+
+@lru_cache(maxsize=256)
+def _get_table_name(model, m2m_field_name=None):
+    table_name = f'{model._meta.app_label}_{model.__name__.lower()}'
+    return f'{table_name}_{m2m_field_name}' if m2m_field_name else table_name
+
+
+@lru_cache(maxsize=256)
+def _get_insert_sql(table_name, keys, row_count=1, returning=True):
+    row_placeholder = sql.SQL('({})').format(sql.SQL(', ').join([sql.Placeholder()] * len(keys)))
+    query = sql.SQL('INSERT INTO {} ({}) VALUES {}').format(
+        sql.Identifier(table_name),
+        sql.SQL(', ').join(map(sql.Identifier, keys)),
+        sql.SQL(', ').join([row_placeholder] * row_count)
+    )
+    return query + sql.SQL(' RETURNING *;') if returning else query
+
+
+@lru_cache(maxsize=256)
+def _get_default_insert_sql(table_name):
+    return sql.SQL('INSERT INTO {} DEFAULT VALUES RETURNING *;').format(
+        sql.Identifier(table_name)
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_update_sql(table_name, keys):
+    return sql.SQL('UPDATE {} SET {} WHERE id = %s RETURNING *;').format(
+        sql.Identifier(table_name),
+        sql.SQL(', ').join(sql.SQL('{} = %s').format(sql.Identifier(key)) for key in keys)
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_delete_sql(table_name, key):
+    return sql.SQL('DELETE FROM {} WHERE {} = %s;').format(
+        sql.Identifier(table_name), sql.Identifier(key)
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_insert_columns(model):
+    relations = _get_field_info(model).relations
+    fk_columns = {
+        field_name: f'{field_name}_id'
+        for field_name, relation_info in relations.items() if not relation_info.to_many
+    }
+    m2m_columns = {
+        field_name: f'{relation_info.related_model.__name__.lower()}_id'
+        for field_name, relation_info in relations.items() if relation_info.to_many
+    }
+    return fk_columns, m2m_columns
+
+
+def _get_pk(value):
+    # Relation values arrive as model instances from PrimaryKeyRelatedField.
+    return getattr(value, 'pk', value)
+
+
+def _should_prepare(row_count):
+    # Multi-VALUES statements differ per batch length; preparing each of them
+    # eagerly would only churn the connection's prepared statement cache.
+    return True if row_count == 1 else None
+
+
+async def _insert_rows(cur, table_name, keys, rows):
+    batch_size = max(1, _MAX_QUERY_PARAMS // len(keys))
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        await cur.execute(
+            _get_insert_sql(table_name, keys, len(batch), returning=False),
+            list(chain.from_iterable(batch)), prepare=_should_prepare(len(batch))
+        )
+
+
+async def _get_pool():
+    loop = asyncio.get_running_loop()
+    pool = _PG_POOLS.get(loop)
+    if pool is None:
+        # A pool's worker tasks keep its loop alive, so entries for loops that
+        # have already been closed (e.g. one per async_to_sync call) are
+        # dropped here rather than left to the weak keys.
+        for stale_loop in [key for key in _PG_POOLS if key.is_closed()]:
+            del _PG_POOLS[stale_loop]
+        con_params = connection.get_connection_params()
+        con_params.pop('cursor_factory', None)
+        # AIODRF_PG_POOL_SIZE caps each loop's pool. Only one connection is
+        # opened eagerly, since short-lived loops rarely need a second one.
+        max_size = max(1, int(getattr(settings, 'AIODRF_PG_POOL_SIZE', 20)))
+        pool = _PG_POOLS[loop] = AsyncConnectionPool(
+            kwargs=con_params, min_size=1, max_size=max_size, open=False
+        )
+    if pool.closed:
+        await pool.open()
+    return pool
+
+
+def _collect_nested_write_sources(serializer):
+    relations = _get_field_info(serializer.Meta.model).relations
+    nested_sources, dotted_sources = [], []
+    for field in serializer._writable_fields:
+        if isinstance(field, BaseSerializer) and field.source in relations:
+            nested_sources.append(field.source)
+        if len(field.source_attrs) > 1 and field.source_attrs[0] in relations:
+            dotted_sources.append(field.source_attrs[0])
+    return tuple(nested_sources), tuple(dotted_sources)
+
+
+def _has_sub_fields(field):
+    return (
+        isinstance(field, BaseSerializer) or
+        hasattr(field, 'child') or hasattr(field, 'child_relation')
+    )
+
+
+def _make_bound_field(field, data, errors):
+    key = field.field_name
+    value = data.get(key)
+    error = errors.get(key) if errors is not None else None
+    if isinstance(field, Serializer):
+        return NestedBoundField(field, value, error)
+    if isinstance(field, JSONField):
+        return JSONBoundField(field, value, error)
+    return BoundField(field, value, error)
+
+
+def _render_field(field, instance):
+    attribute = field.get_attribute(instance)
+    check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+    if check_for_none is None:
+        return None
+    return field.to_representation(attribute)
+
+
+def _render_fields(fields, instance):
+    ret = {}
+    for field in fields:
+        try:
+            ret[field.field_name] = _render_field(field, instance)
+        except SkipField:
+            pass
+    return ret
+
+
+async def raise_errors_on_nested_writes(method_name, serializer, validated_data):
+    nested_sources, dotted_sources = await serializer._nested_write_field_sources()
+    rows = (validated_data,) if isinstance(validated_data, Mapping) else validated_data
+    for data in rows:
+        assert not any(
+            isinstance(data.get(source), (list, dict)) for source in nested_sources
+        ), (
+            'The `.{method_name}()` method does not support writable nested '
+            'fields by default.\nWrite an explicit `.{method_name}()` method for '
+            'serializer `{module}.{class_name}`, or set `read_only=True` on '
+            'nested serializer fields.'.format(
+                method_name=method_name,
+                module=serializer.__class__.__module__,
+                class_name=serializer.__class__.__name__
+            )
+        )
+        assert not any(
+            isinstance(data.get(source), (list, dict)) for source in dotted_sources
+        ), (
+            'The `.{method_name}()` method does not support writable dotted-source '
+            'fields by default.\nWrite an explicit `.{method_name}()` method for '
+            'serializer `{module}.{class_name}`, or set `read_only=True` on '
+            'dotted-source serializer fields.'.format(
+                method_name=method_name,
+                module=serializer.__class__.__module__,
+                class_name=serializer.__class__.__name__
+            )
+        )
 
 
 class SerializerAsync(Serializer, metaclass=SerializerMetaclass):
@@ -32,36 +248,49 @@ class SerializerAsync(Serializer, metaclass=SerializerMetaclass):
             return
 
         for key in keys[:-1]:
-            if key not in dictionary:
-                dictionary[key] = {}
-            dictionary = dictionary[key]
+            dictionary = dictionary.setdefault(key, {})
 
         dictionary[keys[-1]] = value
 
-    @async_cached_property
-    async def fields(self):
-        fields = BindingDict(self)
-        get_fields = await self.get_fields()
-        for key, value in get_fields.items():
-            fields[key] = value
+    @property
+    def fields(self):
+        # Once built, the BindingDict is handed back through a proxy so sync
+        # callers such as DRF's serializer_repr can read it directly.
+        fields = getattr(self, '_fields', None)
+        if fields is not None:
+            return AwaitableProxy(fields)
+        return AwaitableOnly(self._ensure_fields)
+
+    async def _ensure_fields(self):
+        fields = getattr(self, '_fields', None)
+        if fields is None:
+            fields = BindingDict(self)
+            get_fields = await self.get_fields()
+            for key, value in get_fields.items():
+                fields[key] = value
+            self._fields = fields
         return fields
 
-    @property
-    async def _writable_fields(self):
+    async def _writable_fields_list(self):
         fields = await self.fields
-        for field in fields.values():
-            if not field.read_only:
-                yield field
+        return [field for field in fields.values() if not field.read_only]
 
-    @property
-    async def _readable_fields(self):
+    async def _readable_fields_list(self):
         fields = await self.fields
-        for field in fields.values():
-            if not field.write_only:
-                yield field
+        return [field for field in fields.values() if not field.write_only]
 
     async def get_fields(self):
-        return await sync_to_async(deepcopy)(self._declared_fields)
+        cls = type(self)
+        prototype = _FIELDS_CACHE.get(cls)
+        if prototype is None:
+            prototype = _FIELDS_CACHE[cls] = deepcopy(self._declared_fields)
+        # Anything holding a bound sub-field (nested serializers, ListField /
+        # DictField.child, ManyRelatedField.child_relation) is deep-copied so
+        # that sub-field binds to this instance; plain leaf fields are shared-safe.
+        return {
+            key: deepcopy(value) if _has_sub_fields(value) else copy(value)
+            for key, value in prototype.items()
+        }
 
     async def get_initial(self):
         fields = await self.fields
@@ -69,24 +298,28 @@ class SerializerAsync(Serializer, metaclass=SerializerMetaclass):
             if not isinstance(self.initial_data, Mapping):
                 return {}
 
-            return {
-                field_name: await sync_to_async(field.get_value)(self.initial_data)
-                for field_name, field in self.fields.items()
-                if (await sync_to_async(field.get_value)(self.initial_data) is not empty) and
-                not field.read_only
-            }
-
-        return {
-            field.field_name: await field.get_initial()
-            for field in fields.values()
-            if not field.read_only
-        }
+            initial = {}
+            for field_name, field in fields.items():
+                if field.read_only:
+                    continue
+                value = field.get_value(self.initial_data)
+                if isawaitable(value):
+                    value = await value
+                if value is not empty:
+                    initial[field_name] = value
+            return initial
+
+        initial = {}
+        for field in fields.values():
+            if field.read_only:
+                continue
+            value = field.get_initial()
+            initial[field.field_name] = await value if isawaitable(value) else value
+        return initial
 
     async def get_value(self, dictionary):
-        if await sync_to_async(html.is_html_input)(dictionary):
-            return await sync_to_async(
-                html.parse_html_dict
-            )(dictionary, prefix=self.field_name) or empty
+        if html.is_html_input(dictionary):
+            return html.parse_html_dict(dictionary, prefix=self.field_name) or empty
         return dictionary.get(self.field_name, empty)
 
     async def run_validation(self, data=empty):
@@ -100,7 +333,7 @@ class SerializerAsync(Serializer, metaclass=SerializerMetaclass):
             value = await self.validate(value)
             assert value is not None, '.validate() should return the validated data'
         except (ValidationError, DjangoValidationError) as exc:
-            raise ValidationError(detail=await sync_to_async(as_serializer_error)(exc))
+            raise ValidationError(detail=as_serializer_error(exc))
 
         return value
 
@@ -129,6 +362,41 @@ class SerializerAsync(Serializer, metaclass=SerializerMetaclass):
             to_validate = value
             await super().run_validators(to_validate)
 
+    @classmethod
+    def _get_field_validator_names(cls):
+        validator_names = cls.__dict__.get('_field_validator_names')
+        if validator_names is None:
+            validator_names = {
+                name[len('validate_'):]: name
+                for name in dir(cls) if name.startswith('validate_')
+            }
+            cls._field_validator_names = validator_names
+        return validator_names
+
+    def _validate_fields(self, field_values):
+        validator_names = self._get_field_validator_names()
+        return [
+            self._validate_field(field, primitive_value, validator_names.get(field.field_name))
+            for field, primitive_value in field_values
+        ]
+
+    def _validate_field(self, field, primitive_value, validator_name=None):
+        validate_method = None if validator_name is None else getattr(self, validator_name)
+        run_validation = field.run_validation
+        if asyncio.iscoroutinefunction(run_validation):
+            run_validation = async_to_sync(run_validation)
+        try:
+            validated_value = run_validation(primitive_value)
+            if validate_method is not None:
+                validated_value = validate_method(validated_value)
+        except ValidationError as exc:
+            return empty, exc.detail
+        except DjangoValidationError as exc:
+            return empty, get_error_detail(exc)
+        except SkipField:
+            return empty, None
+        return validated_value, None
+
     async def to_internal_value(self, data):
         if not isinstance(data, Mapping):
             message = self.error_messages['invalid'].format(
@@ -140,78 +408,83 @@ class SerializerAsync(Serializer, metaclass=SerializerMetaclass):
 
         ret = {}
         errors = {}
-        fields = await self._writable_fields
-
-        async for field in fields:
-            validate_method = getattr(self, 'validate_' + field.field_name, None)
-            primitive_value = await field.get_value(data)
-            try:
-                validated_value = await sync_to_async(field.run_validation)(primitive_value)
-                if validate_method is not None:
-                    validated_value = validate_method(validated_value)
-            except ValidationError as exc:
-                errors[field.field_name] = exc.detail
-            except DjangoValidationError as exc:
-                errors[field.field_name] = await sync_to_async(get_error_detail)(exc)
-            except SkipField:
-                pass
-            else:
-                await self.set_value(ret, field.source_attrs, validated_value)
+        field_values = []
+        for field in await self._writable_fields_list():
+            primitive_value = field.get_value(data)
+            if isawaitable(primitive_value):
+                primitive_value = await primitive_value
+            field_values.append((field, primitive_value))
+
+        results = await sync_to_async(self._validate_fields)(field_values)
+        for (field, _), (validated_value, error) in zip(field_values, results):
+            if error is not None:
+                errors[field.field_name] = error
+            elif validated_value is not empty:
+                source_attrs = field.source_attrs
+                if len(source_attrs) == 1:
+                    ret[source_attrs[0]] = validated_value
+                else:
+                    await self.set_value(ret, source_attrs, validated_value)
 
         if errors:
             raise ValidationError(errors)
 
         return ret
 
+    async def _field_representation(self, field, instance):
+        attribute = await sync_to_async(field.get_attribute)(instance)
+        check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+        if check_for_none is None:
+            return None
+        return await field.to_representation(attribute)
+
     async def to_representation(self, instance):
+        fields = await self._readable_fields_list()
+        # Sync fields all run on the one thread-sensitive executor anyway, so
+        # render them together in a single hop.
+        rendered = await _get_async_wrapper(_render_fields, True)([
+            field for field in fields
+            if not asyncio.iscoroutinefunction(field.to_representation)
+        ], instance)
         ret = {}
-        async for field in self._readable_fields:
-            try:
-                attribute = await sync_to_async(field.get_attribute)(instance)
-            except SkipField:
-                continue
-            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
-            if check_for_none is None:
-                ret[field.field_name] = None
+        for field in fields:
+            if asyncio.iscoroutinefunction(field.to_representation):
+                try:
+                    ret_field = await self._field_representation(field, instance)
+                except SkipField:
+                    continue
+            elif field.field_name in rendered:
+                ret_field = rendered[field.field_name]
+            else:
                 continue
-            try:
-                ret_field = await sync_to_async(field.to_representation)(attribute)
-            except TypeError:
-                ret_field = await field.to_representation(attribute)
             try:
                 ret_field = [await obj for obj in ret_field]
             except TypeError:
                 pass
-            finally:
-                ret[field.field_name] = ret_field
+            ret[field.field_name] = ret_field
         return ret
 
+    async def _bound_field_sources(self):
+        fields = await self.fields
+        if not hasattr(self, '_data'):
+            await self.data
+        errors = None if not hasattr(self, '_errors') else await self.errors
+        return fields, self._data, errors
+
     async def __aiter__(self):
-        try:
-            fields = await self.fields
-        except TypeError:
-            fields = self.fields
+        fields, data, errors = await self._bound_field_sources()
         for field in fields.values():
-            yield await self[field.field_name]
+            yield _make_bound_field(field, data, errors)
 
     async def __getitem__(self, key):
-        try:
-            fields = await self.fields
-        except TypeError:
-            fields = self.fields
-        field = fields.get(key)
-        value = await self.data
-        value = value.get(key)
-        error = None if not hasattr(self, '_errors') else await self.errors
-        error = error.get(key) if error is not None else None
-        if isinstance(field, Serializer):
-            return NestedBoundField(field, value, error)
-        if isinstance(field, JSONField):
-            return JSONBoundField(field, value, error)
-        return BoundField(field, value, error)
-
-    @async_property
-    async def data(self):
+        fields, data, errors = await self._bound_field_sources()
+        return _make_bound_field(fields[key], data, errors)
+
+    @property
+    def data(self):
+        return _awaitable_value(self, '_data', Serializer.data.fget, self._get_data)
+
+    async def _get_data(self):
         if hasattr(self, 'initial_data') and not hasattr(self, '_validated_data'):
             msg = (
                 'When a serializer is passed a `data` keyword argument you '
@@ -224,25 +497,34 @@ class SerializerAsync(Serializer, metaclass=SerializerMetaclass):
 
         if not hasattr(self, '_data'):
             if self.instance is not None and not getattr(self, '_errors', None):
-                try:
-                    self._data = await sync_to_async(self.to_representation)(self.instance)
-                except TypeError:
+                if asyncio.iscoroutinefunction(self.to_representation):
                     self._data = await self.to_representation(self.instance)
+                else:
+                    self._data = await _get_async_wrapper(
+                        type(self).to_representation, True
+                    )(self, self.instance)
             elif hasattr(self, '_validated_data') and not getattr(self, '_errors', None):
-                self._data = await self.to_representation(self.validated_data)
+                self._data = await self.to_representation(self._validated_data)
+            elif asyncio.iscoroutinefunction(self.get_initial):
+                self._data = await self.get_initial()
             else:
-                try:
-                    self._data = await self.get_initial()
-                except TypeError:
-                    self._data = await sync_to_async(self.get_initial)()
+                self._data = await _get_async_wrapper(type(self).get_initial, True)(self)
         return ReturnDict(self._data, serializer=self)
 
-    @async_property
-    async def errors(self):
-        return await sync_to_async(super().errors.fget)(self)
+    @property
+    def errors(self):
+        return _awaitable_value(self, '_errors', Serializer.errors.fget, self._get_errors)
+
+    async def _get_errors(self):
+        return Serializer.errors.fget(self)
     
-    @async_property
-    async def validated_data(self):
+    @property
+    def validated_data(self):
+        return _awaitable_value(
+            self, '_validated_data', Serializer.validated_data.fget, self._get_validated_data
+        )
+
+    async def _get_validated_data(self):
         if not hasattr(self, '_validated_data'):
             msg = 'You must call `.is_valid()` before accessing `.validated_data`.'
             raise AssertionError(msg)
@@ -250,157 +532,77 @@ class SerializerAsync(Serializer, metaclass=SerializerMetaclass):
 
 
 class ListSerializerAsync(ListSerializer):
-    
+    def __get_async(self, attr_name_str, is_thread_sensitive=True, is_property=False):
+        attr_sync = getattr(ListSerializer, attr_name_str)
+        if is_property:
+            attr_sync = attr_sync.fget
+        return _get_async_wrapper(attr_sync, is_thread_sensitive)
+
+    async def _bound_field_sources(self):
+        fields = self.child.fields
+        if isawaitable(fields):
+            fields = await fields
+        if not hasattr(self, '_data'):
+            await self.adata
+        errors = None if not hasattr(self, '_errors') else await self.aerrors
+        data = self._data[-1] if self._data else {}
+        if isinstance(errors, list):
+            errors = errors[-1] if errors else None
+        return fields, data, errors
+
     async def __aiter__(self):
-        try:
-            fields = await self.child.fields
-        except TypeError:
-            fields = self.child.fields
+        fields, data, errors = await self._bound_field_sources()
         for field in fields.values():
-            yield await self[field.field_name]
+            yield _make_bound_field(field, data, errors)
 
     async def __getitem__(self, key):
-        copy = type(self.child)(self.child.instance, many=True)
-        try:
-            fields = await self.child.fields
-        except TypeError:
-            fields = self.child.fields
-        field = fields.get(key)
-        value = list(await copy.data).pop().get(key)
-        error = None if not hasattr(self, '_errors') else await self.errors
-        error = error.get(key) if error is not None else None
-        if isinstance(field, Serializer):
-            return NestedBoundField(field, value, error)
-        if isinstance(field, JSONField):
-            return JSONBoundField(field, value, error)
-        return BoundField(field, value, error)
-
-    @async_property
-    async def data(self):
-        data = await sync_to_async(ListSerializerAsync.__base__.data.fget)(self)
-        try:
-            data = [await obj for obj in data]
-        except TypeError:
-            pass
-        return ReturnList(data, serializer=self)
-
-    @async_property
-    async def errors(self):
-        try:
-            ret = await sync_to_async(self.child.errors.fget)(self)
-        except TypeError:
-            ret = await self.child.errors.fget(self)
-        if isinstance(ret, list) and len(ret) == 1 and getattr(ret[0], 'code', None) == 'null':
-            detail = ErrorDetail('No data provided', code='null')
-            ret = {api_settings.NON_FIELD_ERRORS_KEY: [detail]}
-        if isinstance(ret, dict):
-            return ReturnDict(ret, serializer=self)
-        return ReturnList(ret, serializer=self)
-
-    async def is_valid(self, *, raise_exception=False):
-        return await sync_to_async(ListSerializerAsync.__base__.is_valid)(**locals())
-
-    async def save(self, **kwargs):
-        assert 'commit' not in kwargs, (
-            "'commit' is not a valid keyword argument to the 'save()' method. "
-            "If you need to access data before committing to the database then "
-            "inspect 'serializer.validated_data' instead. "
-            "You can also pass additional keyword arguments to 'save()' if you "
-            "need to set extra attributes on the saved model instance. "
-            "For example: 'serializer.save(owner=request.user)'.'"
-        )
-
-        validated_data = [
-            {**attrs, **kwargs} for attrs in self.validated_data
-        ]
-
-        if self.instance is not None:
-            self.instance = await self.update(self.instance, validated_data)
-            assert self.instance is not None, (
-                '`update()` did not return an object instance.'
-            )
-        else:
-            self.instance = await self.create(validated_data)
-            assert self.instance is not None, (
-                '`create()` did not return an object instance.'
-            )
+        fields, data, errors = await self._bound_field_sources()
+        return _make_bound_field(fields[key], data, errors)
 
-        return self.instance
     
-    async def create(self, validated_data):
-        return [await self.child.create(attrs) for attrs in validated_data]
-
-    async def acreate(self, validated_data):
-        return await self.child.acreate(validated_data)
-
-    async def update(self, instance, validated_data):
-        raise NotImplementedError(
-            "Serializers with many=True do not support multiple update by "
-            "default, only multiple create. For updates it is unclear how to "
-            "deal with insertions and deletions. If you need to support "
-            "multiple update, use a `ListSerializer` class and override "
-            "`.update()` so you can specify the behavior exactly."
-        )
-
-    async def aupdate(self, instance, validated_data):
-        await self.update()
-
-
-class ListSerializerAsync(ListSerializer):
-    def __get_async(self, attr_name_str, is_thread_sensitive=True, is_property=False):
-        attr_sync = getattr(type(self).__base__.__base__, attr_name_str)
-        if is_property:
-            attr_sync = attr_sync.fget
-        return sync_to_async(attr_sync, thread_sensitive=is_thread_sensitive)
-
-    @cached_property
-    def fields(self):
-        fields = BindingDict(self)
-        fields_items = asyncio.run(self.__get_async('get_fields', False)(self)).items()
-        for key, value in fields_items:
-            fields[key] = value
-        return fields
+    def _chunk_to_representation(self, objs):
+        return [self.child.to_representation(obj) for obj in objs]
+
+    async def _ato_representation(self, queryset, chunk_size=500):
+        to_representation = _get_async_wrapper(type(self)._chunk_to_representation, True)
+        chunk = []
+        async for obj in queryset.aiterator(chunk_size=chunk_size):
+            chunk.append(obj)
+            if len(chunk) == chunk_size:
+                for item in await to_representation(self, chunk):
+                    yield item
+                chunk = []
+        if chunk:
+            for item in await to_representation(self, chunk):
+                yield item
 
     @property
-    def data(self):
-        return asyncio.run(self.__get_async('data', True, True)(self))
-
-    @property
-    def errors(self):
-        ret = asyncio.run(sync_to_async(self.child.errors.fget)(self))
-        if isinstance(ret, list) and len(ret) == 1 and getattr(ret[0], 'code', None) == 'null':
-            # Edge case. Provide a more descriptive error than
-            # "this field may not be null", when no data is passed.
-            detail = ErrorDetail('No data provided', code='null')
-            ret = {api_settings.NON_FIELD_ERRORS_KEY: [detail]}
-        if isinstance(ret, dict):
-            return ReturnDict(ret, serializer=self)
-        return ReturnList(ret, serializer=self)
-
-    def is_valid(self, *args, raise_exception=False):
-        return asyncio.run(self.__get_async('is_valid', False)(
-            self, *args, raise_exception=raise_exception
-        ))
-    
-    @async_property
-    async def adata(self):
+    def adata(self):
+        return _awaitable_value(self, '_data', ListSerializer.data.fget, self._get_adata)
+
+    async def _get_adata(self):
+        if (
+            isinstance(self.instance, QuerySet) and
+            not self.instance._prefetch_related_lookups and
+            not hasattr(self, '_data') and not hasattr(self, 'initial_data')
+        ):
+            self._data = [item async for item in self._ato_representation(self.instance)]
+            return ReturnList(self._data, serializer=self)
         return await self.__get_async('data', True, True)(self)
     
-    @async_property
-    async def avalidated_data(self):
-        return await self.__get_async('validated_data', False, True)(self)
-
-    @async_property
-    async def aerrors(self):
-        ret = await sync_to_async(self.child.errors.fget)(self)
-        if isinstance(ret, list) and len(ret) == 1 and getattr(ret[0], 'code', None) == 'null':
-            # Edge case. Provide a more descriptive error than
-            # "this field may not be null", when no data is passed.
-            detail = ErrorDetail('No data provided', code='null')
-            ret = {api_settings.NON_FIELD_ERRORS_KEY: [detail]}
-        if isinstance(ret, dict):
-            return ReturnDict(ret, serializer=self)
-        return ReturnList(ret, serializer=self)
+    @property
+    def avalidated_data(self):
+        return _awaitable_value(
+            self, '_validated_data', ListSerializer.validated_data.fget,
+            partial(self.__get_async('validated_data', False, True), self)
+        )
+
+    @property
+    def aerrors(self):
+        return _awaitable_value(
+            self, '_errors', ListSerializer.errors.fget,
+            partial(self.__get_async('errors', True, True), self)
+        )
 
     async def ais_valid(self, *args, raise_exception=False):
         return await self.__get_async('is_valid', False)(
@@ -431,15 +633,15 @@ class ListSerializerAsync(ListSerializer):
             "inspect 'serializer.validated_data' instead. "
         )
 
-        validated_data = {**self.validated_data, **kwargs}
+        validated_data = self._get_save_data(self.validated_data, kwargs)
 
         if self.instance is not None:
-            self.instance = asyncio.run(self.update(self.instance, validated_data))
+            self.instance = async_to_sync(self.update)(self.instance, validated_data)
             assert self.instance is not None, (
                 '`update()` did not return an object instance.'
             )
         else:
-            self.instance = asyncio.run(self.create(validated_data))
+            self.instance = async_to_sync(self.create)(validated_data)
             assert self.instance is not None, (
                 '`create()` did not return an object instance.'
             )
@@ -470,7 +672,7 @@ class ListSerializerAsync(ListSerializer):
             "inspect 'serializer.validated_data' instead. "
         )
 
-        validated_data = {**await self.avalidated_data, **kwargs}
+        validated_data = self._get_save_data(await self.avalidated_data, kwargs)
 
         if self.instance is not None:
             self.instance = await self.update(self.instance, validated_data)
@@ -485,7 +687,24 @@ class ListSerializerAsync(ListSerializer):
 
         return self.instance
     
+    def _get_save_data(self, validated_data, kwargs):
+        # Layer kwargs over each row so serializer.validated_data stays as
+        # validated; the child decides whether a view is safe for its create().
+        if not kwargs:
+            return validated_data
+        get_save_data = getattr(self.child, '_get_save_data', None)
+        if get_save_data is None:
+            return [{**attrs, **kwargs} for attrs in validated_data]
+        return [get_save_data(attrs, kwargs) for attrs in validated_data]
+
     async def create(self, validated_data):
+        # The raw INSERT path skips Model.save(), signals, field pre_save hooks
+        # (auto_now, ...) and any surrounding atomic() block, so the child has
+        # to opt in with `Meta.bulk_create = True` and keep the default create().
+        child_cls = type(self.child)
+        if (getattr(getattr(child_cls, 'Meta', None), 'bulk_create', False)
+                and child_cls.create is ModelSerializerAsync.create):
+            return await self.child.acreate(list(validated_data))
         return [await self.child.create(attrs) for attrs in validated_data]
 
     async def acreate(self, validated_data):
@@ -523,51 +742,37 @@ class ModelSerializerAsync(ModelSerializer):
             list_kwargs['max_length'] = max_length
         if min_length is not None:
             list_kwargs['min_length'] = min_length
-        LIST_SERIALIZER_KWARGS = (
-            'read_only', 'write_only', 'required', 'default', 'initial', 'source',
-            'label', 'help_text', 'style', 'error_messages', 'allow_empty',
-            'instance', 'data', 'partial', 'context', 'allow_null',
-            'max_length', 'min_length'
-        )
         list_kwargs.update({
             key: value for key, value in kwargs.items()
-            if key in LIST_SERIALIZER_KWARGS
+            if key in _LIST_SERIALIZER_KWARGS
         })
-        try:
-            return cls.Meta.list_serializer_class(*args, **list_kwargs)
-        except AttributeError:
-            return ListSerializerAsync(*args, **list_kwargs)
+        list_serializer_class = getattr(cls.Meta, 'list_serializer_class', ListSerializerAsync)
+        return list_serializer_class(*args, **list_kwargs)
 
     def __get_async(self, attr_name_str, is_thread_sensitive=True, is_property=False):
-        attr_sync = getattr(type(self).__base__.__base__, attr_name_str)
+        attr_sync = getattr(ModelSerializer, attr_name_str)
         if is_property:
             attr_sync = attr_sync.fget
-        return sync_to_async(attr_sync, thread_sensitive=is_thread_sensitive)
+        return _get_async_wrapper(attr_sync, is_thread_sensitive)
+
+    def _get_save_data(self, validated_data, kwargs):
+        # The default create/update only read validated_data, so it can be
+        # layered instead of copied; overrides may pop keys from it.
+        cls = type(self)
+        if cls.create is ModelSerializerAsync.create and cls.update is ModelSerializerAsync.update:
+            return ChainMap(kwargs, validated_data) if kwargs else validated_data
+        return {**validated_data, **kwargs}
+
+    async def _nested_write_field_sources(self):
+        cls = type(self)
+        sources = cls.__dict__.get('_nested_write_sources')
+        if sources is None:
+            sources = await sync_to_async(
+                _collect_nested_write_sources, thread_sensitive=False
+            )(self)
+            cls._nested_write_sources = sources
+        return sources
 
-    @cached_property
-    def fields(self):
-        fields = BindingDict(self)
-        fields_items = asyncio.run(self.__get_async('get_fields', False)(self)).items()
-        for key, value in fields_items:
-            fields[key] = value
-        return fields
-
-    @property
-    def validated_data(self):
-        return asyncio.run(self.__get_async('validated_data', False, True)(self))
-
-    @property
-    def data(self):
-        return asyncio.run(self.__get_async('data', True, True)(self))
-
-    @property
-    def errors(self):
-        return asyncio.run(self.__get_async('errors', True, True)(self))
-
-    def is_valid(self, *args, raise_exception=False):
-        return asyncio.run(self.__get_async('is_valid', False)(
-            self, *args, raise_exception=raise_exception
-        ))
 
     def save(self, **kwargs):
         assert hasattr(self, '_errors'), (
@@ -593,32 +798,41 @@ class ModelSerializerAsync(ModelSerializer):
             "inspect 'serializer.validated_data' instead. "
         )
 
-        validated_data = {**self.validated_data, **kwargs}
+        validated_data = self._get_save_data(self.validated_data, kwargs)
 
         if self.instance is not None:
-            self.instance = asyncio.run(self.update(self.instance, validated_data))
+            self.instance = async_to_sync(self.update)(self.instance, validated_data)
             assert self.instance is not None, (
                 '`update()` did not return an object instance.'
             )
         else:
-            self.instance = asyncio.run(self.create(validated_data))
+            self.instance = async_to_sync(self.create)(validated_data)
             assert self.instance is not None, (
                 '`create()` did not return an object instance.'
             )
 
         return self.instance
     
-    @async_property
-    async def adata(self):
-        return await self.__get_async('data', True, True)(self)
+    @property
+    def adata(self):
+        return _awaitable_value(
+            self, '_data', ModelSerializer.data.fget,
+            partial(self.__get_async('data', True, True), self)
+        )
     
-    @async_property
-    async def avalidated_data(self):
-        return await self.__get_async('validated_data', False, True)(self)
+    @property
+    def avalidated_data(self):
+        return _awaitable_value(
+            self, '_validated_data', ModelSerializer.validated_data.fget,
+            partial(self.__get_async('validated_data', False, True), self)
+        )
 
-    @async_property
-    async def aerrors(self):
-        return await self.__get_async('errors', True, True)(self)
+    @property
+    def aerrors(self):
+        return _awaitable_value(
+            self, '_errors', ModelSerializer.errors.fget,
+            partial(self.__get_async('errors', True, True), self)
+        )
 
     async def ais_valid(self, *args, raise_exception=False):
         return await self.__get_async('is_valid', False)(
@@ -650,7 +864,7 @@ class ModelSerializerAsync(ModelSerializer):
             "inspect 'serializer.validated_data' instead. "
         )
 
-        validated_data = {**await self.avalidated_data, **kwargs}
+        validated_data = self._get_save_data(await self.avalidated_data, kwargs)
 
         if self.instance is not None:
             self.instance = await self.update(self.instance, validated_data)
@@ -668,11 +882,17 @@ class ModelSerializerAsync(ModelSerializer):
     async def create(self, validated_data):
         await raise_errors_on_nested_writes('create', self, validated_data)
         ModelClass = self.Meta.model
-        info = await sync_to_async(model_meta.get_field_info)(ModelClass)
-        many_to_many = {}
-        for field_name, relation_info in info.relations.items():
-            if relation_info.to_many and (field_name in validated_data):
-                many_to_many[field_name] = validated_data.pop(field_name)
+        info = _get_field_info(ModelClass)
+        many_to_many = {
+            field_name: validated_data[field_name]
+            for field_name, relation_info in info.relations.items()
+            if relation_info.to_many and (field_name in validated_data)
+        }
+        if many_to_many:
+            validated_data = {
+                key: value for key, value in validated_data.items()
+                if key not in many_to_many
+            }
 
         try:
             instance = await ModelClass._default_manager.acreate(**validated_data)
@@ -696,86 +916,99 @@ class ModelSerializerAsync(ModelSerializer):
             )
             raise TypeError(msg)
 
-        if many_to_many:
-            for field_name, value in many_to_many.items():
-                field = getattr(instance, field_name)
-                await field.aset(value)
+        for field_name, value in many_to_many.items():
+            await getattr(instance, field_name).aset(value)
 
         return instance
 
     async def update(self, instance, validated_data):
         await raise_errors_on_nested_writes('update', self, validated_data)
-        info = await sync_to_async(model_meta.get_field_info)(instance)
+        info = _get_field_info(type(instance))
 
         m2m_fields = []
         for attr, value in validated_data.items():
             if attr in info.relations and info.relations[attr].to_many:
                 m2m_fields.append((attr, value))
             else:
-                await sync_to_async(setattr)(instance, attr, value)
+                setattr(instance, attr, value)
 
         await instance.asave()
-        
+
         for attr, value in m2m_fields:
-            field = getattr(instance, attr)
-            await field.aset(value)
+            await getattr(instance, attr).aset(value)
 
         return instance
 
-    # TODO: write the bulk many to many edition functionality
     async def acreate(self, validated_data):
-        validated_data = [validated_data] if type(validated_data) == dict else validated_data
+        if isinstance(validated_data, Mapping):
+            return await self._acreate_one(validated_data)
+        return await self._acreate_many(validated_data)
+
+    async def _acreate_one(self, data):
+        return (await self._acreate_many([data]))[0]
+
+    async def _acreate_many(self, validated_data):
+        if not validated_data:
+            return []
         await raise_errors_on_nested_writes('create', self, validated_data)
         ModelClass = self.Meta.model if hasattr(self.Meta, 'model') else self.child.Meta.model
-        info = await sync_to_async(model_meta.get_field_info)(ModelClass)
+        fk_columns, m2m_columns = _get_insert_columns(ModelClass)
+        rows = []
         many_to_many = {}
-        for data in validated_data:
-            for field_name, relation_info in info.relations.items():
-                rel_data = data.pop(field_name, None)
-                if not relation_info.to_many:
-                    data[field_name + '_id'] = rel_data
-                elif rel_data is not None:
-                    many_to_many[field_name] = [{
-                        relation_info.related_model.__name__.lower() + '_id': x
-                    } for x in rel_data]
-        con_params = connection.get_connection_params()
-        con_params.pop('cursor_factory')
-        async with await AsyncConnection.connect(**con_params) as aconn:
+        for index, data in enumerate(validated_data):
+            row = dict.fromkeys(fk_columns.values())
+            for key, value in data.items():
+                if key in m2m_columns:
+                    if value is not None:
+                        many_to_many.setdefault(key, []).extend(
+                            (index, _get_pk(x)) for x in value
+                        )
+                elif key in fk_columns:
+                    row[fk_columns[key]] = _get_pk(value)
+                else:
+                    row[key] = value
+            rows.append(row)
+        parent_key = ModelClass.__name__.lower() + '_id'
+        pool = await _get_pool()
+        async with pool.connection() as aconn:
             async with aconn.cursor() as cur:
-                table_name = f'{ModelClass._meta.app_label}_{ModelClass.__name__.lower()}'
-                keys = list(key for key in validated_data[0].keys() if key != 'id')
-                values = list(list(data[key] for key in keys) for data in validated_data)
-                is_many = True if len(values) > 1 else False
-                execute_func = cur.executemany if is_many else cur.execute
+                table_name = _get_table_name(ModelClass)
+                keys = tuple(key for key in rows[0] if key != 'id')
+                result = []
                 try:
-                    await execute_func(
-                        f'INSERT INTO {table_name} ({", ".join(keys)}) VALUES '
-                        f'({"".join(("%s, "*len(keys)).rsplit(", ", 1))}) RETURNING *;',
-                        values if is_many else values[0]
-                    )
+                    async with aconn.pipeline(), aconn.transaction():
+                        if not keys:
+                            # Every column is DB-defaulted or automatic.
+                            for _ in rows:
+                                await cur.execute(
+                                    _get_default_insert_sql(table_name), prepare=True
+                                )
+                                result.extend(ModelClass(*obj) for obj in await cur.fetchall())
+                        else:
+                            get_row = itemgetter(*keys)
+                            batch_size = max(1, _MAX_QUERY_PARAMS // len(keys))
+                            for start in range(0, len(rows), batch_size):
+                                batch = rows[start:start + batch_size]
+                                if len(keys) > 1:
+                                    values = list(chain.from_iterable(map(get_row, batch)))
+                                else:
+                                    values = list(map(get_row, batch))
+                                await cur.execute(
+                                    _get_insert_sql(table_name, keys, len(batch)), values,
+                                    prepare=_should_prepare(len(batch))
+                                )
+                                result.extend(ModelClass(*obj) for obj in await cur.fetchall())
+                        for key, val in many_to_many.items():
+                            if val:
+                                await _insert_rows(
+                                    cur, _get_table_name(ModelClass, key),
+                                    (parent_key, m2m_columns[key]),
+                                    [(result[index].id, x) for index, x in val]
+                                )
                 except OperationalError as e:
                     raise OperationalError(
                         f'The {table_name} table has not been modified.'
                     ) from e
-                if is_many:
-                    await cur.execute(f'SELECT * FROM {table_name} ORDER BY ID DESC LIMIT {len(values)}')
-                    return [ModelClass(*obj) for obj in sorted(await cur.fetchall())]
-                result = ModelClass(*await cur.fetchone())
-                for key, val in many_to_many.items():
-                    for x in val:
-                        x[ModelClass.__name__.lower() + '_id'] = result.id
-                    table_name_many = f'{ModelClass._meta.app_label}_{ModelClass.__name__.lower()}_{key}'
-                    if val:
-                        try:
-                            await cur.executemany(
-                                f'INSERT INTO {table_name_many} ({", ".join(val[0].keys())}) '
-                                f'VALUES ({"".join(("%s, " * len(val[0].keys())).rsplit(", ", 1))})',
-                                [list(x.values()) for x in many_to_many[key]]
-                            )
-                        except OperationalError as e:
-                            raise OperationalError(
-                                f'The {table_name} table has not been modified.'
-                            ) from e
                 return result
 
     async def aupdate(self, validated_data):
@@ -783,41 +1016,42 @@ class ModelSerializerAsync(ModelSerializer):
             raise ValueError('Please specify the object id.')
         await raise_errors_on_nested_writes('update', self, validated_data)
         ModelClass = self.Meta.model
-        table_name = f'{ModelClass._meta.app_label}_{ModelClass.__name__.lower()}'
-        info = await sync_to_async(model_meta.get_field_info)(ModelClass)
+        table_name = _get_table_name(ModelClass)
+        info = _get_field_info(ModelClass)
+        fk_columns, m2m_columns = _get_insert_columns(ModelClass)
+        parent_key = ModelClass.__name__.lower() + '_id'
+        obj_id = validated_data['id']
         many_to_many = {}
         for field_name, relation_info in info.relations.items():
             rel_data = validated_data.pop(field_name, None)
             if not relation_info.to_many:
-                validated_data[field_name + '_id'] = rel_data
+                validated_data[fk_columns[field_name]] = _get_pk(rel_data)
             elif rel_data is not None:
-                many_to_many[field_name] = [{
-                    ModelClass.__name__.lower() + '_id': validated_data['id'],
-                    relation_info.related_model.__name__.lower() + '_id': x
-                } for x in rel_data]
-        con_params = connection.get_connection_params()
-        con_params.pop('cursor_factory', None)
-        async with await AsyncConnection.connect(**con_params) as aconn:
+                many_to_many[field_name] = [(obj_id, _get_pk(x)) for x in rel_data]
+        pool = await _get_pool()
+        async with pool.connection() as aconn:
             async with aconn.cursor() as cur:
                 try:
-                    for key, val in many_to_many.items():
-                        table_name_many = f'{ModelClass._meta.app_label}_{ModelClass.__name__.lower()}_{key}'
-                        await cur.execute(f'DELETE FROM {table_name_many};')
-                        if val:
-                            await cur.executemany(
-                                f'INSERT INTO {table_name_many} ({", ".join(val[0].keys())}) '
-                                f'VALUES ({"".join(("%s, " * len(val[0].keys())).rsplit(", ", 1))})',
-                                [list(x.values()) for x in many_to_many[key]]
+                    async with aconn.pipeline(), aconn.transaction():
+                        for key, val in many_to_many.items():
+                            table_name_many = _get_table_name(ModelClass, key)
+                            await cur.execute(
+                                _get_delete_sql(table_name_many, parent_key),
+                                (obj_id,), prepare=True
                             )
-                    await cur.execute(
-                        f'UPDATE {table_name} SET '
-                        f'{" = %s, ".join(validated_data.keys())} = %s '
-                        f'WHERE ID = {validated_data["id"]} RETURNING *;',
-                        list(validated_data.values())
-                    )
+                            if val:
+                                await _insert_rows(
+                                    cur, table_name_many, (parent_key, m2m_columns[key]), val
+                                )
+                        await cur.execute(
+                            _get_update_sql(table_name, tuple(validated_data)),
+                            [*validated_data.values(), obj_id],
+                            prepare=True
+                        )
+                        row = await cur.fetchone()
                 except OperationalError as e:
                     raise OperationalError(
                         f'The {table_name} table has not been modified.'
                     ) from e
                 else:
-                    return ModelClass(*await cur.fetchone())
+                    return ModelClass(*row)
@@ -3,8 +3,11 @@ from asyncio import WindowsSelectorEventLoopPolicy, set_event_loop_policy
 from asgiref.sync import sync_to_async
 from django.test import TestCase, TransactionTestCase
 
+from .generics import ListAPIView
 from .models import Test, TestIncluded
+from .paginations import _get_displayed_page_numbers
 from .serializers import ModelSerializerAsync, SerializerAsync, ListSerializerAsync
+from rest_framework.pagination import _get_displayed_page_numbers as _get_displayed_page_numbers_drf
 from rest_framework.fields import CharField, IntegerField, BooleanField, ChoiceField
 from rest_framework.relations import PrimaryKeyRelatedField
 from rest_framework.utils.serializer_helpers import BoundField
@@ -315,6 +318,28 @@ class TestSerializerAsync(TransactionTestCase):
         self.assertIsInstance(str(serializer), str)
         self.assertGreater(len(str(serializer)), 50)
 
+    async def test_nested_many_context(self):
+        serializer_related = await self._get_serializer_relation()
+
+        class Serializer(SerializerAsync):
+            many_to_many = serializer_related(many=True)
+
+        class SerializerRelated(SerializerAsync):
+            many_to_many = PrimaryKeyRelatedField(
+                queryset=self._main_model.objects, many=True
+            )
+
+        serializers = [Serializer(context={'request': i}) for i in range(2)]
+        for i, serializer in enumerate(serializers):
+            child = (await serializer.fields)[self._many_to_many_name].child
+            self.assertIs(child.root, serializer)
+            self.assertEqual(child.context['request'], i)
+        serializers = [SerializerRelated(context={'request': i}) for i in range(2)]
+        for i, serializer in enumerate(serializers):
+            child = (await serializer.fields)[self._many_to_many_name].child_relation
+            self.assertIs(child.root, serializer)
+            self.assertEqual(child.context['request'], i)
+
     async def test_serializer_async(self):
         serializer = await self._get_serializer()
         obj = await self._main_query.afirst()
@@ -354,3 +379,17 @@ class TestPagination(TestCase):
 
     async def test_pagination(self):
         pass
+
+    def test_displayed_page_numbers(self):
+        for final in range(1, 40):
+            for current in range(1, final + 1):
+                self.assertEqual(
+                    _get_displayed_page_numbers(current, final),
+                    _get_displayed_page_numbers_drf(current, final)
+                )
+
+    async def test_paginate_queryset_without_pagination_class(self):
+        view = ListAPIView(queryset=Test.objects.all(), pagination_class=None)
+        view.request = None
+        self.assertIsNone(await view.paginate_queryset(await view.get_queryset()))
+        self.assertIsNone(await view._ensure_paginator())
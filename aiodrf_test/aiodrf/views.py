@@ -1,9 +1,18 @@
 # Thanks to the adrf package creators
 import asyncio
-from asgiref.sync import sync_to_async
+from contextlib import nullcontext
+from asgiref.sync import SyncToAsync, ThreadSensitiveContext, sync_to_async
 from rest_framework.views import APIView as DRFAPIView
 
 
+def _thread_sensitive_context():
+    # ASGIHandler already opens one per request; nesting another would move
+    # the view's ORM calls onto a second thread with its own connection.
+    if SyncToAsync.thread_sensitive_context.get(None) is not None:
+        return nullcontext()
+    return ThreadSensitiveContext()
+
+
 class APIView(DRFAPIView):
     def sync_dispatch(self, request, *args, **kwargs):
         self.args, self.kwargs = args, kwargs
@@ -30,31 +39,32 @@ class APIView(DRFAPIView):
         return self.response
 
     async def async_dispatch(self, request, *args, **kwargs):
-        self.args, self.kwargs = args, kwargs
-        request = self.initialize_request(request, *args, **kwargs)
-        self.request = request
-        self.headers = self.default_response_headers  # deprecate?
+        async with _thread_sensitive_context():
+            self.args, self.kwargs = args, kwargs
+            request = self.initialize_request(request, *args, **kwargs)
+            self.request = request
+            self.headers = self.default_response_headers  # deprecate?
 
-        try:
-            await sync_to_async(self.initial)(request, *args, **kwargs)
+            try:
+                await sync_to_async(self.initial)(request, *args, **kwargs)
 
-            # Get the appropriate handler method
-            if request.method.lower() in self.http_method_names:
-                handler = getattr(self, request.method.lower(),
-                                  self.http_method_not_allowed)
-            else:
-                handler = self.http_method_not_allowed
+                # Get the appropriate handler method
+                if request.method.lower() in self.http_method_names:
+                    handler = getattr(self, request.method.lower(),
+                                      self.http_method_not_allowed)
+                else:
+                    handler = self.http_method_not_allowed
 
-            if asyncio.iscoroutinefunction(handler):
-                response = await handler(request, *args, **kwargs)
-            else:
-                response = await sync_to_async(handler)(request, *args, **kwargs)
+                if asyncio.iscoroutinefunction(handler):
+                    response = await handler(request, *args, **kwargs)
+                else:
+                    response = await sync_to_async(handler)(request, *args, **kwargs)
 
-        except Exception as exc:
-            response = self.handle_exception(exc)
+            except Exception as exc:
+                response = self.handle_exception(exc)
 
-        self.response = self.finalize_response(request, response, *args, **kwargs)
-        return self.response
+            self.response = self.finalize_response(request, response, *args, **kwargs)
+            return self.response
 
     def dispatch(self, request, *args, **kwargs):
         if getattr(self, 'view_is_async', False):